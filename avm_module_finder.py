@@ -6,13 +6,14 @@ This script analyzes a deployment CSV file containing Azure resources and identi
 matching Azure Verified Modules (AVM) that are available for use.
 
 The script:
-1. Downloads the latest AVM modules list from GitHub
+1. Streams the latest AVM modules list from GitHub (reusing a cached copy
+   when the server reports it unchanged)
 2. Parses the deployment CSV to extract Azure resource information
-3. Matches resources with available AVM modules
+3. Matches resources with available AVM modules as the list is downloaded
 4. Outputs a CSV file with the matched modules
 
 Usage:
-    python3 avm_module_finder.py <deployment_csv_path> [--no-cleanup] [--debug]
+    python3 avm_module_finder.py <deployment_csv_path> [--no-cleanup] [--debug] [--stop-early]
 
 Author: Unknown
 Date: July 3, 2025
@@ -21,94 +22,231 @@ Date: July 3, 2025
 import argparse
 import csv
 import datetime
+import gzip
+import io
 import logging
 import os
+import queue
 import sys
+import urllib.error
 import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, TextIO, Tuple
+
+AVM_MODULES_URL = "https://raw.githubusercontent.com/Azure/Azure-Verified-Modules/main/docs/static/module-indexes/TerraformResourceModules.csv"
+AVM_MODULES_CACHE_FILE = "TerraformResourceModules.csv"
+AVM_MODULES_ETAG_FILE = "TerraformResourceModules.etag"
+
+# Columns copied from the AVM modules CSV into the output CSV
+OUTPUT_COLUMNS = [
+    "ProviderNamespace",
+    "ResourceType",
+    "ModuleName",
+    "ModuleStatus",
+    "RepoURL",
+    "PublicRegistryReference"
+]
+
+# Known naming discrepancies between deployment resources and AVM modules
+# Format: {(namespace, deployment_resource_type): avm_resource_type}
+RESOURCE_TYPE_MAPPINGS = {
+    # Add mappings here if needed in the future
+}
+
+# I/O buffer for the AVM modules CSV (download, cache copy and cached reads);
+# large enough to move the whole index in a handful of calls instead of one per 8 KiB
+AVM_MODULES_READ_BUFFER = 1 << 20
+
+# Directory containing this script; working, output and logs live next to it
+SCRIPT_DIR = Path(__file__).resolve().parent
 
 def setup_directories() -> Tuple[str, str, str]:
     """
     Create working, output, and logs directories if they don't exist.
     
     This function creates three directories in the same location as the script:
-    - working: For temporary files like downloaded AVM module lists
+    - working: For cached files like the last downloaded AVM module list
     - output: For the final output CSV file
     - logs: For log files
     
     Returns:
         Tuple[str, str, str]: Paths to the working, output, and logs directories
     """
-    # Get the directory where the script is located
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    
     # Create directories in the same directory as the script
-    working_dir = os.path.join(script_dir, "working")
-    output_dir = os.path.join(script_dir, "output")
-    logs_dir = os.path.join(script_dir, "logs")
+    working_dir = SCRIPT_DIR / "working"
+    output_dir = SCRIPT_DIR / "output"
+    logs_dir = SCRIPT_DIR / "logs"
     
-    # Create directories if they don't exist
+    # Create directories if they don't exist. Attempting the mkdir directly
+    # avoids a separate existence check and the race between check and create
     for directory in [working_dir, output_dir, logs_dir]:
-        if not os.path.exists(directory):
-            # We can't use logging here yet since it's not set up
-            print(f"Creating directory: {directory}")
+        try:
             os.makedirs(directory)
+        except FileExistsError:
+            continue
+        # We can't use logging here yet since it's not set up
+        print(f"Creating directory: {directory}")
     
-    return working_dir, output_dir, logs_dir
+    return str(working_dir), str(output_dir), str(logs_dir)
 
-def setup_logging(logs_dir: str) -> None:
+def setup_logging(logs_dir: str) -> QueueListener:
     """
     Configure and initialize the logging system.
     
     Sets up logging to both a file and the console with timestamps and log levels.
     The log file name includes a timestamp to avoid overwriting previous logs.
     
+    Logging calls only enqueue the (already formatted) record; a background
+    listener thread does the file and console writes, so the main thread never
+    blocks on log I/O. The caller must stop the returned listener before exiting
+    to flush pending records.
+    
     Args:
         logs_dir (str): Directory where log files should be stored
+        
+    Returns:
+        QueueListener: The started listener writing records to the file and console
     """
     timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
     log_file = os.path.join(logs_dir, f"avm_module_finder_{timestamp}.log")
     
+    # Records are formatted by the QueueHandler, so the listener's handlers
+    # write the message as-is
+    log_queue = queue.SimpleQueue()
+    listener = QueueListener(
+        log_queue,
+        logging.FileHandler(log_file),
+        logging.StreamHandler(sys.stdout)
+    )
+    
     # Configure logging
     logging.basicConfig(
         level=logging.INFO,
         format='%(asctime)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_file),
-            logging.StreamHandler(sys.stdout)
-        ]
+        handlers=[QueueHandler(log_queue)]
     )
+    listener.start()
     
     logging.info(f"Logging initialized. Log file: {log_file}")
+    return listener
+
+class _ResponseGzipFile(gzip.GzipFile):
+    """
+    GzipFile over an HTTP response that also closes the response when closed.
+    
+    gzip.GzipFile leaves a fileobj it was given open, which would keep the
+    connection open after the text stream on top of it is closed.
+    """
+    
+    def __init__(self, response):
+        super().__init__(fileobj=response)
+        self._response = response
+    
+    def close(self):
+        try:
+            super().close()
+        finally:
+            self._response.close()
 
-def download_avm_modules(working_dir: str) -> str:
+def stream_avm_modules(cache_dir: str, url: str = AVM_MODULES_URL) -> Tuple[TextIO, Optional[str]]:
     """
-    Download the latest Azure Verified Modules CSV file from GitHub.
+    Open a text stream over the latest Azure Verified Modules CSV file from GitHub.
     
-    This function fetches the current list of Terraform AVM modules from the
-    official Azure Verified Modules GitHub repository.
+    The CSV is not written to disk first; rows are parsed as they arrive, so the
+    network transfer overlaps with matching. The request advertises gzip, which
+    GitHub honours for raw CSV text and which cuts the transfer several-fold.
+    
+    The last downloaded copy and its ETag are kept in cache_dir. When both are
+    present the request is conditional (If-None-Match), and a 304 Not Modified
+    answer is served from the cached copy without downloading the list again.
+    The caller is responsible for closing the returned stream.
     
     Args:
-        working_dir (str): Directory where the downloaded file should be saved
+        cache_dir (str): Directory holding the cached CSV and its ETag
+        url (str): URL of the Terraform AVM modules index
         
     Returns:
-        str: Path to the downloaded CSV file
+        Tuple[TextIO, Optional[str]]:
+            - Text stream over the CSV content
+            - ETag of a fresh download (empty if the server sent none), to be
+              cached with tee_to_file; None when the stream is the cached copy
         
     Raises:
-        RuntimeError: If the download fails for any reason
+        RuntimeError: If the connection cannot be opened for any reason
     """
-    AVM_MODULES_URL = "https://raw.githubusercontent.com/Azure/Azure-Verified-Modules/main/docs/static/module-indexes/TerraformResourceModules.csv"
-    logging.info(f"Downloading AVM modules from {AVM_MODULES_URL}...")
+    cache_file = os.path.join(cache_dir, AVM_MODULES_CACHE_FILE)
+    etag_file = os.path.join(cache_dir, AVM_MODULES_ETAG_FILE)
+    headers = {'Accept-Encoding': 'gzip'}
+    if os.path.exists(cache_file) and os.path.exists(etag_file):
+        with open(etag_file, 'r', encoding='utf-8') as f:
+            headers['If-None-Match'] = f.read().strip()
+    
+    logging.info(f"Streaming AVM modules from {url}...")
     
-    temp_file = os.path.join(working_dir, "TerraformResourceModules.csv")
     try:
-        urllib.request.urlretrieve(AVM_MODULES_URL, temp_file)
-        logging.info(f"Downloaded AVM modules to {temp_file}")
-        return temp_file
+        request = urllib.request.Request(url, headers=headers)
+        response = urllib.request.urlopen(request, timeout=30)
+    except urllib.error.HTTPError as e:
+        if e.code == 304:
+            logging.info(f"AVM modules unchanged since last download, using cached copy {cache_file}")
+            cached = open(cache_file, 'r', buffering=AVM_MODULES_READ_BUFFER,
+                          encoding='utf-8-sig', newline='')
+            return cached, None
+        logging.error(f"Error opening AVM modules stream: {e}")
+        raise RuntimeError(f"Failed to download AVM modules: {e}")
     except Exception as e:
-        logging.error(f"Error downloading file: {e}")
+        logging.error(f"Error opening AVM modules stream: {e}")
         raise RuntimeError(f"Failed to download AVM modules: {e}")
+    
+    raw = response
+    if response.headers.get('Content-Encoding') == 'gzip':
+        raw = _ResponseGzipFile(response)
+    # Pull the body in large reads rather than the 8 KiB chunks TextIOWrapper asks for
+    raw = io.BufferedReader(raw, buffer_size=AVM_MODULES_READ_BUFFER)
+    etag = response.headers.get('ETag', '')
+    return io.TextIOWrapper(raw, encoding='utf-8-sig', newline=''), etag
+
+def tee_to_file(lines: Iterable[str], file_path: str, etag: Optional[str] = None) -> Iterator[str]:
+    """
+    Yield lines unchanged while copying them to a file.
+    
+    Used to cache the streamed AVM modules CSV without reading the stream twice.
+    The copy is written to a temporary file and moved into place atomically once
+    the source is exhausted, so an interrupted or abandoned download never
+    replaces a good cached copy. If an ETag is given it is stored next to the
+    copy; otherwise any stale ETag is removed.
+    
+    Args:
+        lines (Iterable[str]): Source lines, e.g. the stream from stream_avm_modules
+        file_path (str): Path of the copy to write
+        etag (Optional[str]): ETag the server sent for the content
+        
+    Yields:
+        str: Each line from the source
+    """
+    temp_file = file_path + ".tmp"
+    etag_file = os.path.splitext(file_path)[0] + ".etag"
+    completed = False
+    try:
+        with open(temp_file, 'w', buffering=AVM_MODULES_READ_BUFFER,
+                  newline='', encoding='utf-8') as copy:
+            for line in lines:
+                copy.write(line)
+                yield line
+        completed = True
+    finally:
+        # Abandoned before the end (e.g. --stop-early): discard the partial copy
+        if not completed and os.path.exists(temp_file):
+            os.remove(temp_file)
+    os.replace(temp_file, file_path)
+    if etag:
+        with open(etag_file, 'w', encoding='utf-8') as f:
+            f.write(etag)
+    elif os.path.exists(etag_file):
+        os.remove(etag_file)
+    logging.info(f"Cached a copy of the AVM modules at {file_path}")
 
 def load_deployment_csv(file_path: str) -> Dict[str, List[str]]:
     """
@@ -139,25 +277,39 @@ def load_deployment_csv(file_path: str) -> Dict[str, List[str]]:
     deployment_data = {}
     
     try:
-        with open(file_path, 'r', encoding='utf-8-sig') as csvfile:
-            reader = csv.DictReader(csvfile)
+        with open(file_path, 'r', newline='', encoding='utf-8-sig') as csvfile:
+            reader = csv.reader(csvfile)
+            header = next(reader, [])
             
             # Validate CSV format
-            if 'ProviderNamespace' not in reader.fieldnames or 'ResourceType' not in reader.fieldnames:
+            if 'ProviderNamespace' not in header or 'ResourceType' not in header:
                 logging.error(f"Invalid deployment CSV format. Required columns missing: ProviderNamespace, ResourceType")
                 raise ValueError("Invalid CSV format: Missing required columns.")
             
+            # Resolve column positions once and unpack rows by index
+            namespace_idx = header.index('ProviderNamespace')
+            resource_type_idx = header.index('ResourceType')
+            
+            # Checked once: per-row debug records are skipped entirely unless enabled
+            debug_enabled = logging.getLogger().isEnabledFor(logging.DEBUG)
+            
             for row in reader:
-                namespace = row.get('ProviderNamespace')
-                resource_type = row.get('ResourceType')
+                if not row:
+                    continue
+                namespace = row[namespace_idx] if namespace_idx < len(row) else None
+                resource_type = row[resource_type_idx] if resource_type_idx < len(row) else None
                 
                 if namespace and resource_type:
+                    # Interned so the matcher's pair lookups compare by identity
+                    namespace = sys.intern(namespace)
+                    resource_type = sys.intern(resource_type)
                     if namespace not in deployment_data:
                         deployment_data[namespace] = []
                     deployment_data[namespace].append(resource_type)
-                    logging.debug(f"Found resource: {namespace}/{resource_type}")
+                    if debug_enabled:
+                        logging.debug("Found resource: %s/%s", namespace, resource_type)
                 else:
-                    logging.warning(f"Skipping row with missing data: {row}")
+                    logging.warning("Skipping row with missing data: %s", row)
     except Exception as e:
         logging.error(f"Error reading deployment CSV: {e}")
         raise
@@ -165,109 +317,131 @@ def load_deployment_csv(file_path: str) -> Dict[str, List[str]]:
     logging.info(f"Loaded {len(deployment_data)} provider namespaces from deployment data.")
     return deployment_data
 
-def match_and_filter_modules(avm_modules_file: str, deployment_data: Dict[str, List[str]]) -> Tuple[List[Dict[str, str]], List[str]]:
+def iter_matches(avm_modules: Iterable[str], deployment_data: Dict[str, List[str]],
+                 stop_when_complete: bool = False) -> Iterator[List[str]]:
     """
     Match Azure resources from the deployment CSV with available AVM modules.
     
-    This function reads the AVM modules CSV and finds matches with the resources 
-    specified in the deployment data. It filters the modules to include only those
-    with a status of 'Available'.
+    This generator reads the AVM modules CSV in a single pass and yields matches with
+    the resources specified in the deployment data as they are found, so nothing is
+    accumulated in memory. It filters the modules to include only those
+    with a status of 'Available'. The output columns are OUTPUT_COLUMNS.
     
     The matching process:
     1. Looks for direct matches between provider namespace and resource type
     2. Checks for known naming discrepancies using the RESOURCE_TYPE_MAPPINGS dictionary
     3. Only includes modules with status 'Available'
     
+    With stop_when_complete, reading stops as soon as every wanted pair has an
+    'Available' module. This skips the rest of the (much larger) AVM list, but any
+    further modules for an already matched pair are then not reported.
+    
     Args:
-        avm_modules_file (str): Path to the downloaded AVM modules CSV file
+        avm_modules (Iterable[str]): AVM modules CSV content, e.g. an open file or the
+                                     stream returned by stream_avm_modules
         deployment_data (Dict[str, List[str]]): Dictionary of provider namespaces and resource types
+        stop_when_complete (bool): Stop reading once every wanted pair has been matched
         
-    Returns:
-        Tuple[List[Dict[str, str]], List[str]]: 
-            - List of matched modules (as dictionaries)
-            - List of column names for the output CSV
+    Yields:
+        List[str]: Each matched module as a row of values in OUTPUT_COLUMNS order
             
     Raises:
         ValueError: If the AVM modules CSV format is invalid
     """
     logging.info("Matching modules...")
-    matched_modules = []
+    matched_count = 0
     skipped_modules = []
     parse_errors = 0
     
-    OUTPUT_COLUMNS = [
-        "ProviderNamespace",
-        "ResourceType",
-        "ModuleName",
-        "ModuleStatus",
-        "RepoURL",
-        "PublicRegistryReference"
-    ]
-    
-    # Known naming discrepancies between deployment resources and AVM modules
-    # Format: {(namespace, deployment_resource_type): avm_resource_type}
-    RESOURCE_TYPE_MAPPINGS = {
-        # Add mappings here if needed in the future
+    # Every (namespace, resource_type) pair requested by the deployment, built once
+    # so that each AVM row is matched with a single hash lookup
+    wanted_pairs = {
+        (namespace, resource_type)
+        for namespace, resource_types in deployment_data.items()
+        for resource_type in resource_types
     }
     
+    # AVM resource types reachable through a known naming discrepancy, resolved
+    # up front so the per-row check is also a single hash lookup
+    mapped_pairs = set()
+    mapped_sources = set()
+    for (namespace, deployment_type), avm_type in RESOURCE_TYPE_MAPPINGS.items():
+        if (namespace, deployment_type) in wanted_pairs:
+            logging.info(f"Using mapping: {namespace}/{deployment_type} -> {namespace}/{avm_type}")
+            mapped_pairs.add((namespace, avm_type))
+            mapped_sources.add((namespace, deployment_type))
+    
+    # Pairs still waiting for an 'Available' module (only used with stop_when_complete).
+    # A mapped deployment type never appears in the AVM CSV under its own name, so
+    # only the AVM type it maps to is waited for
+    remaining_pairs = (wanted_pairs - mapped_sources) | mapped_pairs
+    
     try:
-        with open(avm_modules_file, 'r', encoding='utf-8-sig') as csvfile:
-            reader = csv.DictReader(csvfile)
-            
-            # Validate CSV columns
-            missing_columns = [col for col in OUTPUT_COLUMNS if col not in reader.fieldnames]
-            if missing_columns:
-                logging.error(f"AVM modules CSV is missing required columns: {missing_columns}")
-                raise ValueError(f"Invalid AVM modules CSV format: Missing columns {missing_columns}")
-            
-            total_rows = 0
-            for row in reader:
-                total_rows += 1
-                try:
-                    namespace = row.get('ProviderNamespace')
-                    resource_type = row.get('ResourceType')
-                    module_status = row.get('ModuleStatus')
-                    
-                    if not all([namespace, resource_type, module_status]):
-                        logging.warning(f"Skipping row with missing required data: {row}")
-                        skipped_modules.append(f"{namespace or 'Unknown'}/{resource_type or 'Unknown'}")
-                        continue
-                    
-                    # Check for direct match
-                    direct_match = (namespace in deployment_data and 
-                                    resource_type in deployment_data[namespace])
-                    
-                    # Check for known naming discrepancies
-                    mapped_match = False
-                    for deployment_types in deployment_data.get(namespace, []):
-                        mapping_key = (namespace, deployment_types)
-                        if mapping_key in RESOURCE_TYPE_MAPPINGS and RESOURCE_TYPE_MAPPINGS[mapping_key] == resource_type:
-                            mapped_match = True
-                            logging.info(f"Found mapping match: {namespace}/{deployment_types} -> {namespace}/{resource_type}")
-                            break
-                    
-                    if direct_match or mapped_match:
-                        if module_status == "Available":
-                            logging.info(f"Found matching module: {namespace}/{resource_type}")
-                            matched_row = {column: row.get(column, '') for column in OUTPUT_COLUMNS}
-                            matched_modules.append(matched_row)
-                        else:
-                            logging.warning(f"Skipping module with status '{module_status}': {namespace}/{resource_type}")
-                            skipped_modules.append(f"{namespace}/{resource_type}")
-                except Exception as e:
-                    logging.warning(f"Failed to parse module row: {e}")
-                    parse_errors += 1
-            
-            logging.info(f"Processed {total_rows} modules, with {parse_errors} parse errors")
-            if skipped_modules:
-                logging.warning(f"Skipped {len(skipped_modules)} modules that weren't 'Available' or had missing data")
+        reader = csv.reader(avm_modules)
+        header = next(reader, [])
+        
+        # Validate CSV columns
+        missing_columns = [col for col in OUTPUT_COLUMNS if col not in header]
+        if missing_columns:
+            logging.error(f"AVM modules CSV is missing required columns: {missing_columns}")
+            raise ValueError(f"Invalid AVM modules CSV format: Missing columns {missing_columns}")
+        
+        # Resolve column positions once; rows are unpacked by index and only
+        # accepted rows are copied, as a plain list in OUTPUT_COLUMNS order
+        column_idx = {column: header.index(column) for column in OUTPUT_COLUMNS}
+        output_idx = list(column_idx.values())
+        namespace_idx = column_idx['ProviderNamespace']
+        resource_type_idx = column_idx['ResourceType']
+        status_idx = column_idx['ModuleStatus']
+        row_width = max(column_idx.values()) + 1
+        
+        total_rows = 0
+        for row in reader:
+            if not row:
+                continue
+            total_rows += 1
+            try:
+                if len(row) < row_width:
+                    # Short row: treat the missing trailing fields as empty
+                    row = row + [''] * (row_width - len(row))
+                namespace = row[namespace_idx]
+                resource_type = row[resource_type_idx]
+                module_status = row[status_idx]
+                
+                if not all([namespace, resource_type, module_status]):
+                    logging.warning("Skipping row with missing required data: %s", row)
+                    skipped_modules.append(f"{namespace or 'Unknown'}/{resource_type or 'Unknown'}")
+                    continue
+                
+                # Check for a direct match or a known naming discrepancy. Namespaces
+                # come from a small vocabulary; interning them lets the tuple
+                # comparison short-circuit on identity against the deployment keys
+                pair = (sys.intern(namespace), resource_type)
+                if pair in wanted_pairs or pair in mapped_pairs:
+                    if module_status == "Available":
+                        matched_count += 1
+                        yield [row[idx] for idx in output_idx]
+                        if stop_when_complete:
+                            remaining_pairs.discard(pair)
+                            if not remaining_pairs:
+                                logging.info(f"All resource types matched, stopping after {total_rows} modules")
+                                break
+                    else:
+                        skipped_modules.append(f"{namespace}/{resource_type}")
+            except Exception as e:
+                logging.warning("Failed to parse module row: %s", e)
+                parse_errors += 1
+        
+        logging.info(f"Processed {total_rows} modules, with {parse_errors} parse errors")
+        logging.info(f"Found {matched_count} matching modules with status 'Available'")
+        if skipped_modules:
+            logging.warning(f"Skipped {len(skipped_modules)} modules that weren't 'Available' or had missing data")
+            logging.debug(f"Skipped modules: {skipped_modules}")
     except Exception as e:
         logging.error(f"Error processing AVM modules: {e}")
         raise
-    
-    return matched_modules, OUTPUT_COLUMNS
 
-def write_output_csv(matched_modules: List[Dict[str, str]], output_dir: str, column_names: List[str]) -> str:
+def write_output_csv(matched_modules: Iterable[List[str]], output_dir: str, column_names: List[str]) -> Tuple[str, int]:
     """
     Write the matched modules to an output CSV file.
     
@@ -275,47 +449,43 @@ def write_output_csv(matched_modules: List[Dict[str, str]], output_dir: str, col
     containing all the matched AVM modules that are available for the 
     resources in the deployment CSV.
     
+    Rows are written as they are produced (e.g. straight from iter_matches). The
+    file is written under a temporary name and moved into place only on success,
+    so a failure part-way never leaves a truncated AVMModuleMaster.csv behind.
+    
     Args:
-        matched_modules (List[Dict[str, str]]): List of matched module dictionaries
+        matched_modules (Iterable[List[str]]): Matched module rows, with values in column_names order
         output_dir (str): Directory where the output file should be saved
         column_names (List[str]): List of column names for the CSV header
         
     Returns:
-        str: Path to the output CSV file
+        Tuple[str, int]: Path to the output CSV file and the number of modules written
         
     Raises:
-        Exception: If there's an error writing the CSV file
+        Exception: If there's an error producing or writing the rows
     """
     output_file = os.path.join(output_dir, "AVMModuleMaster.csv")
-    logging.info(f"Writing {len(matched_modules)} matched modules to {output_file}...")
+    temp_file = output_file + ".tmp"
+    logging.info(f"Writing matched modules to {output_file}...")
     
     try:
-        with open(output_file, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=column_names)
-            writer.writeheader()
-            writer.writerows(matched_modules)
+        row_count = 0
+        with open(temp_file, 'w', newline='', encoding='utf-8') as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(column_names)
+            for row in matched_modules:
+                writer.writerow(row)
+                row_count += 1
+        os.replace(temp_file, output_file)
         
-        logging.info(f"Successfully wrote data to {output_file}")
-        return output_file
+        logging.info(f"Successfully wrote {row_count} modules to {output_file}")
+        return output_file, row_count
     except Exception as e:
         logging.error(f"Error writing output CSV: {e}")
+        if os.path.exists(temp_file):
+            os.remove(temp_file)
         raise
 
-def cleanup_temp_files(files_to_remove: List[str]) -> None:
-    """
-    Remove temporary files created during script execution.
-    
-    Args:
-        files_to_remove (List[str]): List of file paths to be deleted
-    """
-    for file_path in files_to_remove:
-        if os.path.exists(file_path):
-            try:
-                os.remove(file_path)
-                logging.debug(f"Removed temporary file: {file_path}")
-            except Exception as e:
-                logging.warning(f"Failed to remove temporary file {file_path}: {e}")
-
 def main():
     """
     Main entry point for the AVM module finder script.
@@ -323,22 +493,23 @@ def main():
     This function:
     1. Parses command-line arguments
     2. Sets up directories and logging
-    3. Downloads the latest AVM modules list
+    3. Opens a stream over the latest AVM modules list
     4. Loads and processes the deployment CSV
-    5. Matches resources with available AVM modules
-    6. Writes the results to a CSV file
-    7. Cleans up temporary files (unless --no-cleanup is specified)
+    5. Matches resources with available AVM modules as the list is downloaded
+    6. Writes each match to the output CSV as it is found
     
     Command-line arguments:
         deployment_csv: Path to the deployment CSV file
-        --no-cleanup: Flag to keep temporary files
+        --no-cleanup: Kept for compatibility; the AVM modules list is always cached
         --debug: Enable debug-level logging
+        --stop-early: Stop reading the AVM modules list once everything is matched
         
     Exit codes:
         0: Success
         1: Error
         130: User interrupted (Ctrl+C)
     """
+    log_listener = None
     try:
         # Parse command-line arguments
         parser = argparse.ArgumentParser(
@@ -352,13 +523,19 @@ def main():
         parser.add_argument(
             "--no-cleanup", 
             action="store_true",
-            help="Do not remove temporary files after execution"
+            help="Has no effect; the AVM modules CSV is always cached in the working directory"
         )
         parser.add_argument(
             "--debug", 
             action="store_true",
             help="Enable debug logging"
         )
+        parser.add_argument(
+            "--stop-early",
+            action="store_true",
+            help="Stop reading the AVM modules list once every resource type has a match "
+                 "(further modules for an already matched resource type are not reported)"
+        )
         
         # Display help if no arguments provided
         if len(sys.argv) == 1:
@@ -368,17 +545,16 @@ def main():
         args = parser.parse_args()
         
         # Create directories first without logging (since logging isn't set up yet)
-        script_dir = os.path.dirname(os.path.abspath(__file__))
-        print(f"Script directory: {script_dir}")
+        print(f"Script directory: {SCRIPT_DIR}")
         
         # Create required directory structure
         working_dir, output_dir, logs_dir = setup_directories()
         
         # Initialize logging system
-        setup_logging(logs_dir)
+        log_listener = setup_logging(logs_dir)
         
         # Log important directories
-        logging.info(f"Script directory: {script_dir}")
+        logging.info(f"Script directory: {SCRIPT_DIR}")
         logging.info(f"Working directory: {working_dir}")
         logging.info(f"Output directory: {output_dir}")
         logging.info(f"Logs directory: {logs_dir}")
@@ -393,66 +569,62 @@ def main():
         # Convert relative paths to absolute if needed
         deployment_csv_path = args.deployment_csv
         if not os.path.isabs(deployment_csv_path):
-            # If it's a relative path, consider it relative to the script directory
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            deployment_csv_path = os.path.abspath(os.path.join(script_dir, deployment_csv_path))
+            # If it's a relative path, consider it relative to the script directory.
+            # SCRIPT_DIR is already absolute, so normalising the join is enough
+            deployment_csv_path = os.path.normpath(SCRIPT_DIR / deployment_csv_path)
             logging.info(f"Converted relative path to absolute: {deployment_csv_path}")
         
         logging.info(f"Deployment CSV: {deployment_csv_path}")
         
-        # Track temporary files to clean up
-        temp_files = []
+        # Steps 1 and 2 are independent, so the network round trip that opens the
+        # AVM modules stream overlaps with reading the deployment CSV from disk
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            avm_future = executor.submit(stream_avm_modules, working_dir)
+            deployment_future = executor.submit(load_deployment_csv, deployment_csv_path)
         
-        # Step 1: Download the latest AVM modules list
+        # Step 1: Open a stream over the latest AVM modules list
         try:
-            avm_modules_file = download_avm_modules(working_dir)
-            temp_files.append(avm_modules_file)
+            avm_stream, avm_etag = avm_future.result()
         except Exception as e:
             logging.error(f"Failed to download AVM modules: {e}")
             sys.exit(1)
         
-        # Step 2: Load and parse the deployment CSV file
-        try:
-            deployment_data = load_deployment_csv(deployment_csv_path)
-        except FileNotFoundError as e:
-            logging.error(f"Error: {e}")
-            sys.exit(1)
-        except ValueError as e:
-            logging.error(f"Error in deployment CSV format: {e}")
-            sys.exit(1)
-        except Exception as e:
-            logging.error(f"Unexpected error loading deployment CSV: {e}")
-            sys.exit(1)
-        
-        # Log deployment data summary for verification
-        logging.info("Deployment data summary:")
-        for namespace, resource_types in deployment_data.items():
-            logging.info(f"  {namespace}: {resource_types}")
-        
-        # Step 3: Match Azure resources with available AVM modules
-        try:
-            matched_modules, columns = match_and_filter_modules(avm_modules_file, deployment_data)
-        except Exception as e:
-            logging.error(f"Failed to match modules: {e}")
-            sys.exit(1)
-        
-        # Step 4: Write the results to the output CSV file
-        try:
-            output_file = write_output_csv(matched_modules, output_dir, columns)
-            logging.info(f"Generated output file: {output_file}")
-        except Exception as e:
-            logging.error(f"Failed to write output CSV: {e}")
-            sys.exit(1)
-        
-        # Step 5: Clean up temporary files (unless --no-cleanup is specified)
-        if not args.no_cleanup:
-            cleanup_temp_files(temp_files)
-            logging.info("Temporary files cleaned up")
-        else:
-            logging.info("Temporary files kept (--no-cleanup)")
+        with avm_stream:
+            # Step 2: Load and parse the deployment CSV file
+            try:
+                deployment_data = deployment_future.result()
+            except FileNotFoundError as e:
+                logging.error(f"Error: {e}")
+                sys.exit(1)
+            except ValueError as e:
+                logging.error(f"Error in deployment CSV format: {e}")
+                sys.exit(1)
+            except Exception as e:
+                logging.error(f"Unexpected error loading deployment CSV: {e}")
+                sys.exit(1)
+            
+            # Log deployment data summary for verification
+            logging.info("Deployment data summary:")
+            for namespace, resource_types in deployment_data.items():
+                logging.info(f"  {namespace}: {resource_types}")
+            
+            # Steps 3 and 4: Match Azure resources with available AVM modules while
+            # the list downloads (caching fresh downloads for the next run), and
+            # write each match to the output CSV as it is found
+            avm_modules = avm_stream
+            if avm_etag is not None:
+                avm_cache_file = os.path.join(working_dir, AVM_MODULES_CACHE_FILE)
+                avm_modules = tee_to_file(avm_stream, avm_cache_file, avm_etag)
+            try:
+                matches = iter_matches(avm_modules, deployment_data, stop_when_complete=args.stop_early)
+                output_file, matched_count = write_output_csv(matches, output_dir, OUTPUT_COLUMNS)
+                logging.info(f"Generated output file: {output_file}")
+            except Exception as e:
+                logging.error(f"Failed to match modules and write output CSV: {e}")
+                sys.exit(1)
         
         # Print final summary
-        logging.info(f"Found {len(matched_modules)} matching AVM modules that are available.")
+        logging.info(f"Found {matched_count} matching AVM modules that are available.")
         logging.info("AVM module finder completed successfully")
         
     except KeyboardInterrupt:
@@ -461,6 +633,10 @@ def main():
     except Exception as e:
         logging.error(f"Unhandled error: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        # Flush queued log records and stop the background writer
+        if log_listener:
+            log_listener.stop()
 
 if __name__ == "__main__":
     main()
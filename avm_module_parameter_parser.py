@@ -24,13 +24,18 @@ Date: July 3, 2025
 """
 
 import re
+import copy
+import hashlib
 import json
 import os
 import sys
+import threading
 import time
 import logging
-import traceback
-from typing import Dict, Any, List, Optional, Union, Tuple
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, Optional, Union, Tuple
 
 # Check for required dependencies
 def check_dependencies():
@@ -71,6 +76,26 @@ import requests
 import os
 import requests
 import os
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# ETags of the READMEs saved in working/, keyed by README URL
+_ETAG_CACHE_FILE = ".etag_cache.json"
+
+# Directories already created (or found) by _ensure_dir during this run
+_ENSURED_DIRS = set()
+
+def _ensure_dir(path: str) -> None:
+    """
+    Create a directory if needed, touching the filesystem only once per path.
+    
+    Args:
+        path (str): The directory to create
+    """
+    if path in _ENSURED_DIRS:
+        return
+    os.makedirs(path, exist_ok=True)
+    _ENSURED_DIRS.add(path)
 
 # Create necessary folders
 def ensure_folders_exist():
@@ -81,6 +106,8 @@ def ensure_folders_exist():
     - working: for storing downloaded README.md files
     - output: for storing the generated JSON files
     
+    Each folder is only checked on the first call (see _ensure_dir).
+    
     Returns:
         None
     """
@@ -88,7 +115,7 @@ def ensure_folders_exist():
     folders = ["working", "output"]
     for folder in folders:
         full_path = os.path.join(script_dir, folder)
-        os.makedirs(full_path, exist_ok=True)
+        _ensure_dir(full_path)
         logging.info(f"Ensured folder exists: {folder}")
 
 # Configure logging
@@ -107,7 +134,7 @@ def setup_logging():
     """
     script_dir = os.path.dirname(os.path.abspath(__file__))
     log_folder = os.path.join(script_dir, "logs")
-    os.makedirs(log_folder, exist_ok=True)
+    _ensure_dir(log_folder)
     log_file = os.path.join(log_folder, "parser_log.txt")
     
     logging.basicConfig(
@@ -123,6 +150,113 @@ def setup_logging():
 logger = setup_logging()
 logger = logging.getLogger(__name__)
 
+# Regular expressions used by ReadmeParser, compiled once at import time. The
+# anchors, headings and version strings they match are ASCII, so re.ASCII keeps
+# character classes off the Unicode tables
+_HCL_RE = re.compile(r"```hcl\n(.*?)```", re.DOTALL | re.ASCII)
+_INPUT_NAME_RE = re.compile(r"### <a name=\"input_(.*?)\"></a> \[(.*?)\]", re.ASCII)
+_OUTPUT_NAME_RE = re.compile(r"### <a name=\"output_(.*?)\"></a> \[(.*?)\]", re.ASCII)
+_INPUT_DESC_RE = re.compile(r"Description: (.*?)(?:Type:|$)", re.DOTALL | re.ASCII)
+_OUTPUT_DESC_RE = re.compile(r"Description: (.*?)(?:$)", re.DOTALL | re.ASCII)
+_TYPE_RE = re.compile(r"Type: `(.*?)`", re.ASCII)
+_DEFAULT_RE = re.compile(r"Default: `(.*?)`", re.ASCII)
+_REQ_LINE_RE = re.compile(r'<a name="requirement_(?P<name>[^"]+)"></a>.*?\((?P<version>[^)]+)\)\s*$', re.ASCII)
+_SUBMODULE_NAME_RE = re.compile(
+    r"`([^`]+)`|'([^']+)'|\"([^\"]+)\"|(?:^|\n)-\s+[`'\"]?([^:`'\"\n]+)[`'\"]?(?::|$)",
+    re.MULTILINE | re.ASCII
+)
+_SECTION_SPLIT_RE = re.compile(r"^## ", re.MULTILINE | re.ASCII)
+
+# Module entries of the "Modules" section, in the format:
+# ### <a name="module_name"></a> [name](#module\_name)
+# 
+# Source: ./path/to/module
+_MODULE_ENTRY_RE = re.compile(
+    r"### <a name=\"module_(.*?)\"></a> \[(.*?)\].*?Source: (.*?)(?:\n\n|\Z)",
+    re.DOTALL | re.ASCII
+)
+
+# Common GitHub URL patterns for a module's source, tried in order
+_GITHUB_REPO_RES = (
+    re.compile(r"github\.com[:/]([^/]+/[^/]+)(?:\.git)?$"),
+    re.compile(r"github\.com/([^/]+/[^/]+)"),
+)
+
+# Level-1 heading line holding a README's title, e.g. "# terraform-azurerm-avm-res-keyvault-vault"
+_TITLE_RE = re.compile(r"^# .*", re.MULTILINE)
+
+# Only the first lines of a README are searched for its title
+_TITLE_SEARCH_LINES = 10
+
+# Translation table that strips the markdown escapes from input/output names
+_DEL_BACKSLASH = str.maketrans("", "", "\\")
+
+# Translation table that maps characters unsafe in output/working filenames to "_"
+_SAFE_NAME_TRANS = str.maketrans({"-": "_", " ": "_", "/": "_"})
+
+# Upper bound on threads used to parse submodule READMEs concurrently
+_SUBMODULE_WORKERS = 8
+
+# Upper bound on in-flight submodule README downloads; matches the size of the
+# fetcher's connection pool so every request can reuse a pooled connection
+_SUBMODULE_FETCH_WORKERS = 16
+
+# Parsed README sections keyed on (absolute path, mtime in ns, size), most
+# recently used last, so an unchanged README is never parsed twice per process
+_PARSE_CACHE: "OrderedDict[Tuple[str, int, int], Dict[str, Any]]" = OrderedDict()
+_PARSE_CACHE_SIZE = 256
+
+def _parser_source_hash() -> Optional[str]:
+    """
+    Hash the source of this script, used to version the on-disk parse cache.
+    
+    Returns:
+        Optional[str]: The hex digest, or None if the source can't be read
+    """
+    try:
+        with open(os.path.abspath(__file__), 'rb') as file:
+            return hashlib.sha1(file.read()).hexdigest()
+    except OSError:
+        return None
+
+# On-disk cache of parse_readme_directly results, one JSON file per README
+# content hash. Entries are also keyed on this script's source, so any change
+# to the parser invalidates them; without a readable source the cache is off.
+_DISK_PARSE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "working", ".parse_cache")
+_DISK_PARSE_CACHE_VERSION = _parser_source_hash()
+_DISK_PARSE_CACHE_MAX_FILES = 1024
+
+# Markers of a Terraform module README: common level-2 section headings and code fences
+_TERRAFORM_INDICATORS = frozenset({
+    "Required Inputs",
+    "Optional Inputs",
+    "Outputs",
+    "Requirements",
+    "Providers",
+    "Resources",
+    "Modules"
+})
+_TERRAFORM_CODE_FENCES = ["```hcl", "```terraform"]
+
+def _iter_entries(name_re: re.Pattern, section_text: str) -> Iterator[Tuple[re.Match, str]]:
+    """
+    Yield each anchored entry of an inputs or outputs section.
+    
+    An entry runs from one name anchor to the next (or the end of the section)
+    and is sliced straight out of section_text.
+    
+    Args:
+        name_re (re.Pattern): _INPUT_NAME_RE or _OUTPUT_NAME_RE
+        section_text (str): The text of the section
+        
+    Yields:
+        Tuple[re.Match, str]: The name anchor match and the entry text
+    """
+    matches = list(name_re.finditer(section_text))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(section_text)
+        yield match, section_text[match.start():end]
+
 class ReadmeParser:
     """
     Parser for Terraform module README.md files to extract inputs and outputs.
@@ -152,6 +286,14 @@ class ReadmeParser:
         self.outputs = {}
         self.submodules = {}
         self.module_name = os.path.basename(readme_path).replace("_README.md", "")
+        # Level-2 sections of self.content, split on first use; _sections_source
+        # is the content they were split from, so reassigning content invalidates them
+        self._sections = None
+        self._sections_source = None
+        # _PARSE_CACHE key of the file self.content was read from, valid while
+        # self.content is still _cache_key_source
+        self._cache_key = None
+        self._cache_key_source = None
         
     def read_file(self) -> str:
         """
@@ -159,7 +301,8 @@ class ReadmeParser:
         
         This method reads the file at the path provided during initialization,
         stores its content in the object, and performs a basic validation to
-        check if it appears to be a Terraform module README.
+        check if it appears to be a Terraform module README. The file is read
+        only once; later calls return the stored content.
         
         Returns:
             str: The content of the README.md file, or an empty string if file not found
@@ -169,14 +312,19 @@ class ReadmeParser:
             - WARNING: When file doesn't appear to be a Terraform module README
             - ERROR: When file is not found or other errors occur
         """
+        if self.content:
+            return self.content
+        
         try:
-            with open(self.readme_path, 'r') as file:
-                self.content = file.read()
-            logger.info(f"Successfully read {self.readme_path} file")
+            stat = os.stat(self.readme_path)
+            self.content = Path(self.readme_path).read_text(encoding="utf-8")
+            self._cache_key = (os.path.abspath(self.readme_path), stat.st_mtime_ns, stat.st_size)
+            self._cache_key_source = self.content
+            logger.info("Successfully read %s file", self.readme_path)
             
             # Validate if this is a Terraform module README
             if not self.is_terraform_module_readme():
-                logger.warning(f"File {self.readme_path} does not appear to be a Terraform module README")
+                logger.warning("File %s does not appear to be a Terraform module README", self.readme_path)
                 print(f"Warning: {self.readme_path} may not be a valid Terraform module README.")
                 
             return self.content
@@ -184,8 +332,7 @@ class ReadmeParser:
             logger.error(f"Error: File {self.readme_path} not found.")
             return ""
         except Exception as e:
-            logger.error(f"Error reading file: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Error reading file: {e}")
             return ""
     
     def is_terraform_module_readme(self) -> bool:
@@ -193,43 +340,82 @@ class ReadmeParser:
         Check if the README appears to be for a Terraform module.
         
         This method looks for common section headers and code block formats
-        that typically appear in Terraform module documentation.
+        that typically appear in Terraform module documentation. The headers are
+        looked up in the section table that extract_section uses, so the content
+        is split once for both.
         
         Returns:
             bool: True if it appears to be a Terraform module README, False otherwise
             
         Algorithm:
-            1. Checks for common section headers like "Required Inputs", "Outputs", etc.
-            2. Checks for Terraform/HCL code blocks
+            1. Counts common section headers like "Required Inputs", "Outputs", etc.
+            2. With exactly 1 header found, checks for Terraform/HCL code blocks
             3. Returns True if at least 2 indicators are found
         """
-        # Check for common sections in Terraform module READMEs
-        terraform_indicators = [
-            "## Required Inputs",
-            "## Optional Inputs",
-            "## Outputs",
-            "## Requirements",
-            "## Providers",
-            "## Resources",
-            "## Modules"
-        ]
-        
         # Count how many indicators are present
-        matches = sum(1 for indicator in terraform_indicators if indicator in self.content)
+        matches = len(_TERRAFORM_INDICATORS & self._get_sections().keys())
         
-        # Also check for terraform code blocks
-        if "```hcl" in self.content or "```terraform" in self.content:
-            matches += 1
-            
         # If at least 2 indicators are present, it's likely a Terraform module README
-        return matches >= 2
+        if matches >= 2:
+            return True
+        
+        # Terraform code blocks count as one more indicator
+        return matches == 1 and any(fence in self.content for fence in _TERRAFORM_CODE_FENCES)
+    
+    def _split_sections(self) -> Dict[str, str]:
+        """
+        Split the README content into its level-2 sections in a single pass.
+        
+        Returns:
+            Dict[str, str]: Mapping of heading text to the unstripped section body,
+                not including the heading, in document order. If a heading
+                repeats, the first occurrence wins.
+        """
+        sections = {}
+        # The first chunk is whatever precedes the first level-2 heading
+        for chunk in _SECTION_SPLIT_RE.split(self.content)[1:]:
+            heading, _, body = chunk.partition("\n")
+            sections.setdefault(heading.rstrip(), body)
+        return sections
+    
+    @staticmethod
+    def _lookup_section(sections: Dict[str, str], section_name: str) -> str:
+        """
+        Find the first section whose heading starts with section_name.
+        
+        Headings such as "Outputs (2)" match "Outputs"; the rest of the heading
+        line is kept at the start of the returned text.
+        
+        Args:
+            sections (Dict[str, str]): The result of _split_sections
+            section_name (str): The name of the section to find
+            
+        Returns:
+            str: The section's content, or empty string if no heading matches
+        """
+        for heading, body in sections.items():
+            if heading.startswith(section_name):
+                return f"{heading[len(section_name):]}\n{body}".strip()
+        return ""
+    
+    def _get_sections(self) -> Dict[str, str]:
+        """
+        Return the level-2 sections of the content, splitting it on first use.
+        
+        Returns:
+            Dict[str, str]: Mapping of heading text to section body
+        """
+        if self._sections is None or self._sections_source is not self.content:
+            self._sections = self._split_sections()
+            self._sections_source = self.content
+        return self._sections
     
     def extract_section(self, section_name: str) -> str:
         """
         Extract a section from the README.md file based on its heading.
         
-        This method uses regex to find a section that starts with a given heading
-        and ends at the next heading or end of file.
+        The content is split into sections once, on the first call, and later
+        calls are dictionary lookups until the content changes.
         
         Args:
             section_name (str): The name of the section to extract, e.g., "Required Inputs"
@@ -239,14 +425,27 @@ class ReadmeParser:
                  Returns empty string if section not found.
                  
         Note:
-            The regex pattern looks for a level-2 heading (##) with the exact section name,
-            and captures all content until the next level-2 heading or end of file.
+            A section starts at the first level-2 heading (##) that begins with the
+            section name, and runs until the next level-2 heading or end of file.
         """
-        pattern = rf"## {section_name}(.*?)(?:^##\s|\Z)"
-        match = re.search(pattern, self.content, re.DOTALL | re.MULTILINE)
-        if match:
-            return match.group(1).strip()
-        return ""
+        return self._lookup_section(self._get_sections(), section_name)
+    
+    def extract_all_sections(self, section_names: List[str]) -> Dict[str, str]:
+        """
+        Extract several sections from the README.md file at once.
+        
+        All sections come from the same single pass over the content that
+        extract_section uses.
+        
+        Args:
+            section_names (List[str]): The names of the sections to extract
+            
+        Returns:
+            Dict[str, str]: The content of each section, keyed by name in the order
+                requested; empty string for sections that are not found.
+        """
+        sections = self._get_sections()
+        return {name: self._lookup_section(sections, name) for name in section_names}
     
     def extract_hcl_block(self, text: str) -> str:
         """
@@ -260,13 +459,12 @@ class ReadmeParser:
             str: The HCL code block content without the surrounding backticks.
                  Returns empty string if no HCL block is found.
         """
-        pattern = r"```hcl\n(.*?)```"
-        match = re.search(pattern, text, re.DOTALL)
+        match = _HCL_RE.search(text)
         if match:
             return match.group(1).strip()
         return ""
     
-    def parse_input_entry(self, entry: str) -> Dict[str, Any]:
+    def parse_input_entry(self, entry: str, name_match: Optional[re.Match] = None) -> Dict[str, Any]:
         """
         Parse a single input entry from the README.md file.
         
@@ -278,6 +476,8 @@ class ReadmeParser:
         
         Args:
             entry (str): The markdown text of a single input entry
+            name_match (Optional[re.Match]): The entry's name anchor, if the caller
+                has already matched it; searched for in entry otherwise
             
         Returns:
             Dict[str, Any]: A dictionary with the parsed input information:
@@ -295,34 +495,36 @@ class ReadmeParser:
             optionally a default value.
         """
         # Extract the input name
-        name_match = re.search(r"### <a name=\"input_(.*?)\"></a> \[(.*?)\]", entry)
+        if name_match is None:
+            name_match = _INPUT_NAME_RE.search(entry)
         if not name_match:
-            logger.debug(f"No name match found in input entry: {entry[:100]}...")
+            logger.debug("No name match found in input entry: %s...", entry[:100])
             return {}
         
         # Remove backslashes from input name
-        input_name = name_match.group(2).replace("\\", "")
+        input_name = name_match.group(2).translate(_DEL_BACKSLASH)
         
         # Extract the description
-        desc_match = re.search(r"Description: (.*?)(?:Type:|$)", entry, re.DOTALL)
+        desc_match = _INPUT_DESC_RE.search(entry)
         description = desc_match.group(1).strip() if desc_match else ""
         
         # Extract the type
         type_value = ""
-        type_match = re.search(r"Type: `(.*?)`", entry)
+        type_match = _TYPE_RE.search(entry)
         if type_match:
             type_value = type_match.group(1)
         
         # Extract HCL type if present - use the actual HCL content for complex types
-        hcl_block = self.extract_hcl_block(entry)
-        if hcl_block:
-            type_value = hcl_block.strip()
+        if "```hcl" in entry:
+            hcl_block = self.extract_hcl_block(entry)
+            if hcl_block:
+                type_value = hcl_block.strip()
         
         # Extract default value if present
-        default_match = re.search(r"Default: `(.*?)`", entry)
+        default_match = _DEFAULT_RE.search(entry)
         default_value = default_match.group(1) if default_match else None
         
-        logger.debug(f"Parsed input: {input_name}")
+        logger.debug("Parsed input: %s", input_name)
         result = {
             "name": input_name,
             "description": description,
@@ -334,30 +536,32 @@ class ReadmeParser:
             
         return result
     
-    def parse_output_entry(self, entry: str) -> Dict[str, Any]:
+    def parse_output_entry(self, entry: str, name_match: Optional[re.Match] = None) -> Dict[str, Any]:
         """
         Parse a single output entry from the README.md file.
         
         Args:
             entry: The text of a single output entry
+            name_match: The entry's name anchor, if already matched by the caller
             
         Returns:
             A dictionary with the parsed output information
         """
         # Extract the output name
-        name_match = re.search(r"### <a name=\"output_(.*?)\"></a> \[(.*?)\]", entry)
+        if name_match is None:
+            name_match = _OUTPUT_NAME_RE.search(entry)
         if not name_match:
-            logger.debug(f"No name match found in output entry: {entry[:100]}...")
+            logger.debug("No name match found in output entry: %s...", entry[:100])
             return {}
         
         # Remove backslashes from output name
-        output_name = name_match.group(2).replace("\\", "")
+        output_name = name_match.group(2).translate(_DEL_BACKSLASH)
         
         # Extract the description
-        desc_match = re.search(r"Description: (.*?)(?:$)", entry, re.DOTALL)
+        desc_match = _OUTPUT_DESC_RE.search(entry)
         description = desc_match.group(1).strip() if desc_match else ""
         
-        logger.debug(f"Parsed output: {output_name}")
+        logger.debug("Parsed output: %s", output_name)
         return {
             "name": output_name,
             "description": description
@@ -374,13 +578,9 @@ class ReadmeParser:
         Returns:
             A dictionary mapping input names to their parsed information
         """
-        # Split the section into individual input entries
-        entries = re.split(r"### <a name=\"input_", section_text)
-        
         result = {}
-        for entry in entries[1:]:  # Skip the first entry (section header)
-            entry = "### <a name=\"input_" + entry  # Add back the split pattern
-            parsed_entry = self.parse_input_entry(entry)
+        for name_match, entry in _iter_entries(_INPUT_NAME_RE, section_text):
+            parsed_entry = self.parse_input_entry(entry, name_match)
             if parsed_entry and "name" in parsed_entry:
                 input_name = parsed_entry["name"]
                 parsed_entry["required"] = is_required
@@ -398,13 +598,9 @@ class ReadmeParser:
         Returns:
             A dictionary mapping output names to their parsed information
         """
-        # Split the section into individual output entries
-        entries = re.split(r"### <a name=\"output_", section_text)
-        
         result = {}
-        for entry in entries[1:]:  # Skip the first entry (section header)
-            entry = "### <a name=\"output_" + entry  # Add back the split pattern
-            parsed_entry = self.parse_output_entry(entry)
+        for name_match, entry in _iter_entries(_OUTPUT_NAME_RE, section_text):
+            parsed_entry = self.parse_output_entry(entry, name_match)
             if parsed_entry and "name" in parsed_entry:
                 output_name = parsed_entry["name"]
                 result[output_name] = parsed_entry
@@ -421,20 +617,12 @@ class ReadmeParser:
         if not self.content:
             self.read_file()
         
-        # Extract sections
-        requirements_section = self.extract_section("Requirements")
-        required_inputs_section = self.extract_section("Required Inputs")
-        optional_inputs_section = self.extract_section("Optional Inputs")
-        outputs_section = self.extract_section("Outputs")
-        submodules_section = self.extract_section("Submodules")
-        
-        # Parse sections
-        self.required_inputs = self.parse_inputs_section(required_inputs_section, True)
-        self.optional_inputs = self.parse_inputs_section(optional_inputs_section, False)
-        self.outputs = self.parse_outputs_section(outputs_section)
-        
-        # Parse requirements
-        module_requirements = self.parse_requirements_section(requirements_section)
+        sections = self._parse_sections()
+        self.required_inputs = sections["required_inputs"]
+        self.optional_inputs = sections["optional_inputs"]
+        self.outputs = sections["outputs"]
+        module_requirements = sections["module_requirements"]
+        submodules_section = sections["submodules_section"]
         
         # Process submodules if they exist
         if submodules_section:
@@ -442,7 +630,8 @@ class ReadmeParser:
             self.process_submodules(submodules_section)
         
         # Combine all inputs
-        all_inputs = {**self.required_inputs, **self.optional_inputs}
+        all_inputs = self.required_inputs.copy()
+        all_inputs.update(self.optional_inputs)
         
         # Get the module name from the file path
         module_name = self.module_name
@@ -468,6 +657,49 @@ class ReadmeParser:
             
         return result
         
+    def _parse_sections(self) -> Dict[str, Any]:
+        """
+        Parse the README's own sections: inputs, outputs, requirements and submodules.
+        
+        Results for content read from a file are memoized in _PARSE_CACHE, keyed on
+        the file's path, modification time and size, so an unchanged README is
+        parsed only once. Callers always receive their own copy.
+        
+        Returns:
+            A dictionary with the keys "required_inputs", "optional_inputs",
+            "outputs", "module_requirements" and "submodules_section"
+        """
+        cache_key = self._cache_key if self._cache_key_source is self.content else None
+        if cache_key is not None and cache_key in _PARSE_CACHE:
+            _PARSE_CACHE.move_to_end(cache_key)
+            logger.debug("Using cached parse of %s", self.readme_path)
+            return copy.deepcopy(_PARSE_CACHE[cache_key])
+        
+        # Extract sections
+        section_texts = self.extract_all_sections(
+            ["Requirements", "Required Inputs", "Optional Inputs", "Outputs", "Submodules"]
+        )
+        requirements_section = section_texts["Requirements"]
+        required_inputs_section = section_texts["Required Inputs"]
+        optional_inputs_section = section_texts["Optional Inputs"]
+        outputs_section = section_texts["Outputs"]
+        submodules_section = section_texts["Submodules"]
+        
+        # Parse sections
+        sections = {
+            "required_inputs": self.parse_inputs_section(required_inputs_section, True),
+            "optional_inputs": self.parse_inputs_section(optional_inputs_section, False),
+            "outputs": self.parse_outputs_section(outputs_section),
+            "module_requirements": self.parse_requirements_section(requirements_section),
+            "submodules_section": submodules_section
+        }
+        
+        if cache_key is not None:
+            _PARSE_CACHE[cache_key] = copy.deepcopy(sections)
+            if len(_PARSE_CACHE) > _PARSE_CACHE_SIZE:
+                _PARSE_CACHE.popitem(last=False)
+        return sections
+    
     def parse_requirements_section(self, section: str) -> Dict[str, Any]:
         """
         Parse the Requirements section of the README.md file.
@@ -483,46 +715,41 @@ class ReadmeParser:
             return {}
             
         logger.info("Parsing Requirements section")
-        logger.debug(f"Requirements section content: {section}")
+        logger.debug("Requirements section content: %s", section)
         
         # Parse requirements table
         terraform_version = None
         providers = {}
         
         # Process the requirements section line by line
-        lines = section.split('\n')
-        for line in lines:
+        for line in section.split('\n'):
             # Check for list format: "- <a name="requirement_terraform"></a> [terraform](#requirement\_terraform) (>= 1.9, < 2.0)"
-            if '<a name="requirement_' in line and '(' in line and ')' in line:
-                # Extract the requirement name
-                name_match = re.search(r'<a name="requirement_([^"]+)"></a>', line)
-                if not name_match:
-                    continue
-                
-                req_name = name_match.group(1)
-                
-                # Extract version from the parentheses at the end of the line
-                version_match = re.search(r'\(([^)]+)\)$', line.strip())
-                if not version_match:
-                    continue
-                    
-                req_version = version_match.group(1).strip()
-                logger.debug(f"Found requirement: {req_name}, version: {req_version}")
+            if '<a name="requirement_' not in line:
+                continue
+            
+            # Extract the requirement name and the version from the parentheses at the end of the line
+            requirement_match = _REQ_LINE_RE.search(line)
+            if not requirement_match:
+                continue
+            
+            req_name = requirement_match.group("name")
+            req_version = requirement_match.group("version").strip()
+            logger.debug("Found requirement: %s, version: %s", req_name, req_version)
+            
+            # Handle terraform requirement
+            if req_name == "terraform":
+                terraform_version = req_version
+            # Handle provider requirements
+            else:
+                # Create provider entry
+                providers[req_name] = {
+                    "source": f"hashicorp/{req_name}",  # Default source
+                    "version": req_version
+                }
                 
-                # Handle terraform requirement
-                if req_name == "terraform":
-                    terraform_version = req_version
-                # Handle provider requirements
-                else:
-                    # Create provider entry
-                    providers[req_name] = {
-                        "source": f"hashicorp/{req_name}",  # Default source
-                        "version": req_version
-                    }
-                    
-                    # Handle special case for modtm provider
-                    if req_name == "modtm":
-                        providers[req_name]["source"] = "azure/modtm"
+                # Handle special case for modtm provider
+                if req_name == "modtm":
+                    providers[req_name]["source"] = "azure/modtm"
         
         # Construct the module_requirements structure
         module_requirements = {}
@@ -544,76 +771,125 @@ class ReadmeParser:
         """
         Process submodules mentioned in the README.
         
+        Submodule READMEs are located first, then read and parsed in parallel
+        on a small thread pool; results are recorded in the order the submodules
+        are mentioned.
+        
         Args:
             submodules_section: The section of the README that mentions submodules
         """
         # Extract submodule names using a regular expression
-        submodule_pattern = r"`([^`]+)`|'([^']+)'|\"([^\"]+)\"|(?:^|\n)-\s+[`'\"]?([^:`'\"\n]+)[`'\"]?(?::|$)"
-        submodule_matches = re.finditer(submodule_pattern, submodules_section, re.MULTILINE)
+        submodule_matches = _SUBMODULE_NAME_RE.finditer(submodules_section)
         
         base_dir = os.path.dirname(self.readme_path)
+        modules_dir = os.path.join(base_dir, "modules")
+        found_readmes = []
+        
+        # List the candidate directories once rather than probing every path
+        search_dirs = []
+        for directory in (modules_dir, base_dir):
+            try:
+                with os.scandir(directory or ".") as entries:
+                    search_dirs.append((directory, {e.name for e in entries if e.is_dir()}))
+            except OSError:
+                continue
         
         for match in submodule_matches:
-            # Find the first non-None group (the submodule name)
-            submodule_name = next((g for g in match.groups() if g is not None), None)
+            # Each alternative captures the name in its own group, and exactly one
+            # alternative matched, so the last group that matched holds the name
+            submodule_name = match.group(match.lastindex)
             if not submodule_name:
                 continue
                 
-            logger.info(f"Found potential submodule: {submodule_name}")
-            
-            # Check for README in modules/{submodule_name} directory
-            potential_paths = [
-                os.path.join(base_dir, "modules", submodule_name, "README.md"),
-                os.path.join(base_dir, submodule_name, "README.md"),
-                os.path.join(base_dir, "modules", submodule_name, "README.md")
-            ]
+            logger.info("Found potential submodule: %s", submodule_name)
             
+            # Check for README in modules/{submodule_name}, then {submodule_name}.
+            # Names that are absolute or start with "." or ".." don't resolve to
+            # a listed subdirectory, so those are probed directly
+            top_level_dir = os.path.normpath(submodule_name).split(os.sep, 1)[0]
+            probe_directly = top_level_dir in ("", os.curdir, os.pardir)
             submodule_readme_path = None
-            for path in potential_paths:
+            for directory, subdirs in search_dirs:
+                if not probe_directly and top_level_dir not in subdirs:
+                    continue
+                path = os.path.join(directory, submodule_name, "README.md")
                 if os.path.exists(path):
                     submodule_readme_path = path
-                    logger.info(f"Found README for submodule '{submodule_name}' at: {path}")
+                    logger.info("Found README for submodule '%s' at: %s", submodule_name, path)
                     break
             
             if not submodule_readme_path:
-                logger.warning(f"Could not find README for submodule '{submodule_name}'")
+                logger.warning("Could not find README for submodule '%s'", submodule_name)
                 continue
             
-            # Parse the submodule README
-            try:
-                # Create a new parser for the submodule
-                submodule_parser = ReadmeParser(submodule_readme_path)
-                submodule_parser.read_file()
-                
-                # Extract sections from the submodule README
-                required_inputs = submodule_parser.extract_section("Required Inputs")
-                optional_inputs = submodule_parser.extract_section("Optional Inputs")
-                outputs = submodule_parser.extract_section("Outputs")
-                
-                # Parse the sections
-                req_inputs_data = submodule_parser.parse_inputs_section(required_inputs, True)
-                opt_inputs_data = submodule_parser.parse_inputs_section(optional_inputs, False)
-                outputs_data = submodule_parser.parse_outputs_section(outputs)
-                
-                # Combine all inputs
-                all_inputs = {**req_inputs_data, **opt_inputs_data}
-                
-                # Add to the submodules dictionary
-                self.submodules[submodule_name] = {
-                    "name": submodule_name,
-                    "inputs": all_inputs,
-                    "outputs": outputs_data,
-                    "description": ""
-                }
-                
-                logger.info(f"Successfully parsed submodule '{submodule_name}'")
-                logger.info(f"  - Required inputs: {len(req_inputs_data)}")
-                logger.info(f"  - Optional inputs: {len(opt_inputs_data)}")
-                logger.info(f"  - Outputs: {len(outputs_data)}")
-                
-            except Exception as e:
-                logger.error(f"Error parsing submodule '{submodule_name}': {e}")
-                logger.error(traceback.format_exc())
+            found_readmes.append((submodule_name, submodule_readme_path))
+        
+        if not found_readmes:
+            return
+        
+        # Parse the submodule READMEs
+        with ThreadPoolExecutor(max_workers=min(_SUBMODULE_WORKERS, len(found_readmes))) as executor:
+            results = list(executor.map(lambda found: self._parse_submodule(*found), found_readmes))
+        
+        for (submodule_name, _), result in zip(found_readmes, results):
+            if result is None:
+                continue
+            submodule_data, required_count, optional_count = result
+            
+            # Add to the submodules dictionary
+            self.submodules[submodule_name] = submodule_data
+            
+            logger.info("Successfully parsed submodule '%s'", submodule_name)
+            logger.info("  - Required inputs: %d", required_count)
+            logger.info("  - Optional inputs: %d", optional_count)
+            logger.info("  - Outputs: %d", len(submodule_data['outputs']))
+    
+    @staticmethod
+    def _parse_submodule(submodule_name: str, readme_path: str) -> Optional[Tuple[Dict[str, Any], int, int]]:
+        """
+        Read and parse one submodule README.
+        
+        Args:
+            submodule_name: The name of the submodule
+            readme_path: Path to the submodule's README.md file
+            
+        Returns:
+            A tuple of (submodule data, number of required inputs, number of
+            optional inputs), or None if parsing failed
+        """
+        try:
+            # Create a new parser for the submodule
+            submodule_parser = ReadmeParser(readme_path)
+            submodule_parser.read_file()
+            
+            # Extract sections from the submodule README
+            sections = submodule_parser.extract_all_sections(["Required Inputs", "Optional Inputs", "Outputs"])
+            required_inputs = sections["Required Inputs"]
+            optional_inputs = sections["Optional Inputs"]
+            outputs = sections["Outputs"]
+            
+            # Parse the sections
+            req_inputs_data = submodule_parser.parse_inputs_section(required_inputs, True)
+            opt_inputs_data = submodule_parser.parse_inputs_section(optional_inputs, False)
+            outputs_data = submodule_parser.parse_outputs_section(outputs)
+            
+            required_count = len(req_inputs_data)
+            optional_count = len(opt_inputs_data)
+            
+            # Combine all inputs (req_inputs_data is not used on its own after this)
+            all_inputs = req_inputs_data
+            all_inputs.update(opt_inputs_data)
+            
+            return {
+                "name": submodule_name,
+                "inputs": all_inputs,
+                "outputs": outputs_data,
+                "description": ""
+            }, required_count, optional_count
+            
+        except Exception as e:
+            logger.exception(f"Error parsing submodule '{submodule_name}': {e}")
+            return None
     
     def set_submodules(self, submodules_data: Dict[str, Dict[str, Any]]):
         """
@@ -624,6 +900,50 @@ class ReadmeParser:
         """
         self.submodules = submodules_data
     
+    def _check_module_requirements(self, parsed_data: Dict[str, Any]) -> None:
+        """
+        Warn if the parsed data has no module_requirements block.
+        
+        Args:
+            parsed_data: The result of parse(), keyed by self.module_name
+        """
+        if 'module_requirements' not in parsed_data.get(self.module_name, {}):
+            logger.warning(f"module_requirements is NOT present in the parsed data for {self.module_name}")
+        elif logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"module_requirements is present in the parsed data for {self.module_name}")
+    
+    def _output_data(self) -> Optional[Dict[str, Any]]:
+        """
+        Parse the README into the data written as JSON output.
+        
+        Returns:
+            The parsed data, or None if nothing was parsed
+        """
+        parsed_data = self.parse()
+        if not parsed_data:
+            logger.error("No data was parsed, cannot convert to JSON")
+            return None
+        
+        self._check_module_requirements(parsed_data)
+        return parsed_data
+    
+    @staticmethod
+    def _open_output_file(output_path: str):
+        """
+        Open an output file for writing, creating its directory if needed.
+        
+        Args:
+            output_path: Path of the file to write
+            
+        Returns:
+            The open file
+        """
+        # Ensure output directory exists if there's a directory part
+        dir_path = os.path.dirname(output_path)
+        if dir_path:
+            _ensure_dir(dir_path)
+        return open(output_path, 'w')
+    
     def to_json(self, output_path: str = None) -> str:
         """
         Convert the parsed information to JSON and optionally save it to a file.
@@ -635,44 +955,55 @@ class ReadmeParser:
             The JSON string
         """
         try:
-            parsed_data = self.parse()
-            if not parsed_data:
-                logger.error("No data was parsed, cannot convert to JSON")
+            parsed_data = self._output_data()
+            if parsed_data is None:
                 return ""
                 
             try:
-                # Add debug output to check if module_requirements is in the parsed data
-                if 'module_requirements' in next(iter(parsed_data.values())):
-                    logger.debug(f"module_requirements is present in the parsed data for {next(iter(parsed_data.keys()))}")
-                else:
-                    logger.warning(f"module_requirements is NOT present in the parsed data for {next(iter(parsed_data.keys()))}")
-                
-                json_str = json.dumps(parsed_data, indent=2)
+                json_str = json.dumps(parsed_data, indent=2, check_circular=False)
             except Exception as e:
-                logger.error(f"Error converting data to JSON: {e}")
-                logger.error(traceback.format_exc())
+                logger.exception(f"Error converting data to JSON: {e}")
                 return ""
             
             if output_path:
                 try:
-                    # Ensure output directory exists if there's a directory part
-                    dir_path = os.path.dirname(output_path)
-                    if dir_path:  # Only try to create the directory if there's a directory part
-                        os.makedirs(dir_path, exist_ok=True)
-                    
-                    with open(output_path, 'w') as file:
+                    with self._open_output_file(output_path) as file:
                         file.write(json_str)
                     logger.info(f"JSON data written to {output_path}")
                 except Exception as e:
-                    logger.error(f"Error writing to file {output_path}: {e}")
-                    logger.error(traceback.format_exc())
+                    logger.exception(f"Error writing to file {output_path}: {e}")
                     return json_str  # Return the JSON string even if file write fails
             
             return json_str
         except Exception as e:
-            logger.error(f"Unexpected error in to_json: {e}")
-            logger.error(traceback.format_exc())
+            logger.exception(f"Unexpected error in to_json: {e}")
             return ""
+    
+    def write_json(self, output_path: str) -> bool:
+        """
+        Parse the README and write the JSON straight to a file.
+        
+        Unlike to_json, the JSON is encoded directly into the file rather than
+        built as one string first.
+        
+        Args:
+            output_path: Path to save the JSON to
+            
+        Returns:
+            True if the file was written, False otherwise
+        """
+        try:
+            parsed_data = self._output_data()
+            if parsed_data is None:
+                return False
+            
+            with self._open_output_file(output_path) as file:
+                json.dump(parsed_data, file, indent=2, check_circular=False)
+            logger.info(f"JSON data written to {output_path}")
+            return True
+        except Exception as e:
+            logger.exception(f"Error writing JSON to file {output_path}: {e}")
+            return False
 
 class TerraformRegistryFetcher:
     """
@@ -707,6 +1038,25 @@ class TerraformRegistryFetcher:
         self.github_repo = None
         self.source_url = None
         self.repo_branch = None  # Will store the default branch (main or master)
+        
+        # Where fetched READMEs are saved, and the module part of their filenames
+        self._working_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), "working")
+        self._module_base = self.name.replace("-", "_")
+        
+        # One pooled session for all Registry and GitHub requests, so connections
+        # (and their TLS handshakes) are reused across the module and its submodules
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        ))
+        
+        # ETags of saved READMEs, loaded from _ETAG_CACHE_FILE on first use; the
+        # lock serializes access from concurrent submodule fetches
+        self._etag_cache = None
+        self._etag_cache_dir = None
+        self._etag_lock = threading.Lock()
     
     def _parse_module_name(self, module_name: str) -> Tuple[str, str, str]:
         """
@@ -771,7 +1121,7 @@ class TerraformRegistryFetcher:
         logger.info(f"Fetching module information from: {api_url}")
         
         try:
-            response = requests.get(api_url)
+            response = self.session.get(api_url, timeout=10)
             response.raise_for_status()
             module_data = response.json()
             
@@ -797,14 +1147,8 @@ class TerraformRegistryFetcher:
         Returns:
             The GitHub repository in the format "owner/repo", or None if not a GitHub repo
         """
-        # Common GitHub URL patterns
-        github_patterns = [
-            r"github\.com[:/]([^/]+/[^/]+)(?:\.git)?$",
-            r"github\.com/([^/]+/[^/]+)",
-        ]
-        
-        for pattern in github_patterns:
-            match = re.search(pattern, source_url)
+        for pattern in _GITHUB_REPO_RES:
+            match = pattern.search(source_url)
             if match:
                 repo = match.group(1)
                 # Remove .git suffix if present
@@ -817,13 +1161,20 @@ class TerraformRegistryFetcher:
         logger.error(f"Could not extract GitHub repository from: {source_url}")
         return None
     
-    def fetch_readme_content(self, github_repo: str, path: str = "") -> Optional[Tuple[str, str]]:
+    def fetch_readme_content(self, github_repo: str, path: str = "",
+                             cache_path: Optional[str] = None) -> Optional[Tuple[str, str]]:
         """
         Fetch the README.md content from the GitHub repository.
         
+        When cache_path is given, the fetched README is saved there and the URL's
+        ETag is recorded in the .etag_cache.json file of the same directory. Later
+        fetches send the ETag in If-None-Match, and a 304 Not Modified answer is
+        served from the saved copy without downloading or rewriting it.
+        
         Args:
             github_repo: The GitHub repository in the format "owner/repo"
             path: Optional path to the README within the repository
+            cache_path: Optional local file to save the README to and revalidate against
             
         Returns:
             A tuple of (README content, branch used), or None if not found
@@ -844,22 +1195,115 @@ class TerraformRegistryFetcher:
         
         for path in readme_paths:
             url = f"{self.github_raw_base_url}/{path}"
-            logger.info(f"Trying to fetch README from: {url}")
+            logger.info("Trying to fetch README from: %s", url)
+            
+            request_headers = {}
+            cached_etag = self._get_cached_etag(url, cache_path) if cache_path else None
+            if cached_etag:
+                request_headers["If-None-Match"] = cached_etag
             
             try:
-                response = requests.get(url)
-                if response.status_code == 200:
-                    logger.info(f"Successfully fetched README from: {url}")
-                    # Determine which branch worked
-                    branch = "main" if "main" in url else "master"
-                    self.repo_branch = branch
-                    return response.text, branch
+                response = self.session.get(url, headers=request_headers, timeout=10)
+                content = None
+                if response.status_code == 304 and cached_etag:
+                    try:
+                        content = Path(cache_path).read_text(encoding="utf-8")
+                        logger.info("README unchanged since last download, using cached copy %s", cache_path)
+                    except (OSError, UnicodeDecodeError) as e:
+                        # The saved copy is gone or damaged; download it again
+                        logger.warning("Cached copy %s is unreadable, fetching it again: %s", cache_path, e)
+                        response = self.session.get(url, timeout=10)
+                if content is None:
+                    if response.status_code != 200:
+                        continue
+                    logger.info("Successfully fetched README from: %s", url)
+                    content = response.text
+                    if cache_path:
+                        self._save_readme(url, cache_path, content, response.headers.get("ETag"))
+                
+                # Determine which branch worked
+                branch = "main" if "main" in url else "master"
+                self.repo_branch = branch
+                return content, branch
             except requests.RequestException as e:
                 logger.error(f"Error fetching README from {url}: {e}")
         
         logger.error(f"Could not fetch README from GitHub repository: {github_repo}, path: {path}")
         return None
     
+    def _load_etag_cache(self, cache_dir: str) -> Dict[str, Dict[str, str]]:
+        """
+        Return the ETag cache of a directory, reading it from disk on first use.
+        
+        Must be called with self._etag_lock held.
+        
+        Args:
+            cache_dir: Directory holding the cached READMEs
+            
+        Returns:
+            Mapping of README URL to {"etag": ..., "filename": ...}
+        """
+        if self._etag_cache is None or self._etag_cache_dir != cache_dir:
+            self._etag_cache = {}
+            self._etag_cache_dir = cache_dir
+            try:
+                with open(os.path.join(cache_dir, _ETAG_CACHE_FILE), 'r', encoding='utf-8') as file:
+                    etag_cache = json.load(file)
+                if not isinstance(etag_cache, dict):
+                    raise ValueError("not a JSON object")
+                self._etag_cache = etag_cache
+            except FileNotFoundError:
+                pass
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable ETag cache in {cache_dir}: {e}")
+        return self._etag_cache
+    
+    def _get_cached_etag(self, url: str, cache_path: str) -> Optional[str]:
+        """
+        Look up the ETag of a README URL whose copy is still saved at cache_path.
+        
+        Args:
+            url: The README URL
+            cache_path: Local file the README is saved to
+            
+        Returns:
+            The ETag to revalidate with, or None if there is no usable cached copy
+        """
+        with self._etag_lock:
+            entry = self._load_etag_cache(os.path.dirname(cache_path)).get(url)
+        if (isinstance(entry, dict) and entry.get("filename") == os.path.basename(cache_path)
+                and isinstance(entry.get("etag"), str) and os.path.exists(cache_path)):
+            return entry["etag"]
+        return None
+    
+    def _save_readme(self, url: str, cache_path: str, content: str, etag: Optional[str]) -> None:
+        """
+        Save a fetched README and record its ETag, forgetting any stale ETag.
+        
+        Args:
+            url: The README URL
+            cache_path: Path to save the README to
+            content: The README content
+            etag: ETag the server sent for the content, if any
+        """
+        cache_dir = os.path.dirname(cache_path)
+        _ensure_dir(cache_dir)
+        Path(cache_path).write_text(content, encoding="utf-8")
+        logger.info("Saved README to: %s", cache_path)
+        
+        with self._etag_lock:
+            etags = self._load_etag_cache(cache_dir)
+            if etag:
+                etags[url] = {"etag": etag, "filename": os.path.basename(cache_path)}
+            elif etags.pop(url, None) is None:
+                return
+            
+            # Write to a temporary file first so readers never see a partial cache
+            etag_cache_path = os.path.join(cache_dir, _ETAG_CACHE_FILE)
+            with open(etag_cache_path + ".tmp", 'w', encoding='utf-8') as file:
+                json.dump(etags, file, indent=2)
+            os.replace(etag_cache_path + ".tmp", etag_cache_path)
+    
     def fetch_and_save_readme(self) -> Optional[str]:
         """
         Fetch the README.md from the Terraform Registry and save it locally.
@@ -878,39 +1322,27 @@ class TerraformRegistryFetcher:
                 logger.error("Failed to extract GitHub repository from source URL")
                 return None
             
-            readme_result = self.fetch_readme_content(github_repo)
+            # Generate a filename based on the module name
+            readme_filename = os.path.join(self._working_dir, f"{self._module_base}_README.md")
+            
+            # Fetch the README, saving it to (or revalidating) the local copy
+            readme_result = self.fetch_readme_content(github_repo, cache_path=readme_filename)
             if not readme_result:
                 logger.error("Failed to fetch README content from GitHub repository")
                 return None
-                
-            readme_content, _ = readme_result
             
-            # Generate a filename based on the module name
-            module_filename = self.name.replace("-", "_")
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            readme_filename = os.path.join(script_dir, "working", f"{module_filename}_README.md")
-            
-            # Save the README content to a file
-            try:
-                working_dir = os.path.join(script_dir, "working")
-                os.makedirs(working_dir, exist_ok=True)
-                with open(readme_filename, 'w') as file:
-                    file.write(readme_content)
-                logger.info(f"Saved README to: {readme_filename}")
-                return readme_filename
-            except Exception as e:
-                logger.error(f"Error saving README to file: {e}")
-                logger.error(traceback.format_exc())
-                return None
-        except Exception as e:
-            logger.error(f"Unexpected error in fetch_and_save_readme: {e}")
-            logger.error(traceback.format_exc())
+            return readme_filename
+        except (OSError, requests.RequestException) as e:
+            logger.exception(f"Unexpected error in fetch_and_save_readme: {e}")
             return None
             
     def fetch_submodule_readme(self, submodule_path: str, submodule_name: str) -> Optional[str]:
         """
         Fetch a submodule's README.md file from GitHub.
         
+        The parent module's repository must already be known, i.e.
+        fetch_and_save_readme() must have succeeded so that github_repo is set.
+        
         Args:
             submodule_path: The path to the submodule in the repository
             submodule_name: The name of the submodule
@@ -919,10 +1351,6 @@ class TerraformRegistryFetcher:
             The path to the saved README.md file, or None if failed
         """
         try:
-            if not self.github_repo:
-                logger.error("GitHub repository not initialized")
-                return None
-                
             # Ensure path doesn't have leading/trailing slashes
             submodule_path = submodule_path.strip('/')
             
@@ -930,39 +1358,80 @@ class TerraformRegistryFetcher:
             if submodule_path.startswith('./'):
                 submodule_path = submodule_path[2:]
             
-            logger.info(f"Fetching README for submodule {submodule_name} from path: {submodule_path}")
+            logger.info("Fetching README for submodule %s from path: %s", submodule_name, submodule_path)
             
-            # Fetch README content
-            readme_result = self.fetch_readme_content(self.github_repo, submodule_path)
+            # Generate a unique filename for the submodule README
+            submodule_safe_name = submodule_name.translate(_SAFE_NAME_TRANS)
+            readme_filename = os.path.join(self._working_dir, f"{self._module_base}_{submodule_safe_name}_README.md")
+            
+            # Fetch the README, saving it to (or revalidating) the local copy
+            readme_result = self.fetch_readme_content(self.github_repo, submodule_path, cache_path=readme_filename)
             if not readme_result:
                 logger.error(f"Failed to fetch README content for submodule: {submodule_name}")
                 return None
-                
-            readme_content, _ = readme_result
-            
-            # Generate a unique filename for the submodule README
-            module_base = self.name.replace("-", "_")
-            submodule_safe_name = submodule_name.replace("-", "_").replace("/", "_")
-            script_dir = os.path.dirname(os.path.abspath(__file__))
-            readme_filename = os.path.join(script_dir, "working", f"{module_base}_{submodule_safe_name}_README.md")
             
-            # Save the README content to a file
-            try:
-                working_dir = os.path.join(script_dir, "working")
-                os.makedirs(working_dir, exist_ok=True)
-                with open(readme_filename, 'w') as file:
-                    file.write(readme_content)
-                logger.info(f"Saved submodule README to: {readme_filename}")
-                return readme_filename
-            except Exception as e:
-                logger.error(f"Error saving submodule README to file: {e}")
-                logger.error(traceback.format_exc())
-                return None
-        except Exception as e:
-            logger.error(f"Unexpected error in fetch_submodule_readme: {e}")
-            logger.error(traceback.format_exc())
+            return readme_filename
+        except (OSError, requests.RequestException) as e:
+            logger.exception(f"Unexpected error in fetch_submodule_readme: {e}")
             return None
 
+def _load_cached_parse(content_hash: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a parse_readme_directly result from the on-disk parse cache.
+    
+    A hit refreshes the entry's modification time, which the cache uses as its
+    least-recently-used order.
+    
+    Args:
+        content_hash (str): Hash of the README content (and parser source)
+        
+    Returns:
+        Optional[Dict[str, Any]]: The cached {"inputs", "outputs"} result, or None
+    """
+    cache_file = os.path.join(_DISK_PARSE_CACHE_DIR, f"{content_hash}.json")
+    try:
+        with open(cache_file, 'r', encoding='utf-8') as file:
+            result = json.load(file)
+        if not (isinstance(result, dict) and isinstance(result.get("inputs"), dict)
+                and isinstance(result.get("outputs"), dict)):
+            raise ValueError("not an {\"inputs\", \"outputs\"} object")
+        os.utime(cache_file)
+        return result
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError) as e:
+        logger.warning("Ignoring unreadable parse cache entry %s: %s", cache_file, e)
+        return None
+
+def _store_cached_parse(content_hash: str, result: Dict[str, Any]) -> None:
+    """
+    Save a parse_readme_directly result to the on-disk parse cache.
+    
+    When the cache holds more than _DISK_PARSE_CACHE_MAX_FILES entries, the least
+    recently used ones are removed. Failures are logged and otherwise ignored.
+    
+    Args:
+        content_hash (str): Hash of the README content (and parser source)
+        result (Dict[str, Any]): The {"inputs", "outputs"} result to cache
+    """
+    cache_file = os.path.join(_DISK_PARSE_CACHE_DIR, f"{content_hash}.json")
+    # Per-process temporary name, as several runs may share working/
+    temp_file = f"{cache_file}.{os.getpid()}.tmp"
+    try:
+        _ensure_dir(_DISK_PARSE_CACHE_DIR)
+        with open(temp_file, 'w', encoding='utf-8') as file:
+            json.dump(result, file, check_circular=False)
+        os.replace(temp_file, cache_file)
+        
+        with os.scandir(_DISK_PARSE_CACHE_DIR) as entries:
+            cached_files = [e for e in entries if e.name.endswith(".json")]
+        if len(cached_files) > _DISK_PARSE_CACHE_MAX_FILES:
+            cached_files.sort(key=lambda e: e.stat().st_mtime_ns)
+            for entry in cached_files[:len(cached_files) - _DISK_PARSE_CACHE_MAX_FILES]:
+                os.remove(entry.path)
+    except OSError as e:
+        logger.warning("Could not update parse cache %s: %s", cache_file, e)
+
 def parse_readme_directly(readme_path):
     """
     Parse a README.md file directly to extract inputs and outputs.
@@ -1001,50 +1470,110 @@ def parse_readme_directly(readme_path):
         which might have slight format differences from the main module README.
     """
     try:
-        # Check if file exists
-        if not os.path.exists(readme_path):
+        # Read the README content in one unbuffered read, translating newlines
+        # as text mode would
+        try:
+            with open(readme_path, 'rb', buffering=0) as file:
+                readme_content = file.read().decode('utf-8')
+            readme_content = readme_content.replace('\r\n', '\n').replace('\r', '\n')
+        except FileNotFoundError:
             logger.error(f"README file does not exist: {readme_path}")
             return {"inputs": {}, "outputs": {}}
-            
-        # Read the README content
-        try:
-            with open(readme_path, 'r') as file:
-                readme_content = file.read()
-        except Exception as e:
-            logger.error(f"Error reading README file {readme_path}: {e}")
-            logger.error(traceback.format_exc())
+        except (OSError, UnicodeDecodeError) as e:
+            logger.exception(f"Error reading README file {readme_path}: {e}")
             return {"inputs": {}, "outputs": {}}
         
-        # Create a temporary parser instance
-        parser = ReadmeParser(readme_path)
-        parser.content = readme_content  # Set content directly
-        
-        # Extract sections
-        required_inputs_section = parser.extract_section("Required Inputs")
-        optional_inputs_section = parser.extract_section("Optional Inputs")
-        outputs_section = parser.extract_section("Outputs")
-        
-        # Parse sections
-        required_inputs = parser.parse_inputs_section(required_inputs_section, True)
-        optional_inputs = parser.parse_inputs_section(optional_inputs_section, False)
-        outputs = parser.parse_outputs_section(outputs_section)
-        
-        # Combine all inputs
-        all_inputs = {**required_inputs, **optional_inputs}
+        # Reuse the result of an earlier run if this exact content was parsed before
+        content_hash = None
+        cached = None
+        if _DISK_PARSE_CACHE_VERSION:
+            content_hash = hashlib.sha1(
+                f"{_DISK_PARSE_CACHE_VERSION}\0{readme_content}".encode("utf-8")
+            ).hexdigest()
+            cached = _load_cached_parse(content_hash)
+        if cached is not None:
+            logger.info("Loaded parse of %s from the parse cache", readme_path)
+            all_inputs = cached["inputs"]
+            outputs = cached["outputs"]
+        else:
+            # Create a temporary parser instance
+            parser = ReadmeParser(readme_path)
+            parser.content = readme_content  # Set content directly
+            
+            # Extract sections
+            sections = parser.extract_all_sections(["Required Inputs", "Optional Inputs", "Outputs"])
+            required_inputs_section = sections["Required Inputs"]
+            optional_inputs_section = sections["Optional Inputs"]
+            outputs_section = sections["Outputs"]
+            
+            # Parse sections
+            required_inputs = parser.parse_inputs_section(required_inputs_section, True)
+            optional_inputs = parser.parse_inputs_section(optional_inputs_section, False)
+            outputs = parser.parse_outputs_section(outputs_section)
+            
+            # Combine all inputs (required_inputs is not used on its own after this)
+            all_inputs = required_inputs
+            all_inputs.update(optional_inputs)
+            
+            if content_hash:
+                _store_cached_parse(content_hash, {"inputs": all_inputs, "outputs": outputs})
         
-        logger.info(f"Parsed README {readme_path}: found {len(all_inputs)} inputs and {len(outputs)} outputs")
-        logger.info(f"Required inputs: {sum(1 for inp in all_inputs.values() if inp.get('required', False))}")
-        logger.info(f"Optional inputs: {sum(1 for inp in all_inputs.values() if not inp.get('required', True))}")
+        logger.info("Parsed README %s: found %d inputs and %d outputs", readme_path, len(all_inputs), len(outputs))
+        logger.info("Required inputs: %d", sum(1 for inp in all_inputs.values() if inp.get('required', False)))
+        logger.info("Optional inputs: %d", sum(1 for inp in all_inputs.values() if not inp.get('required', True)))
         
         return {
             "inputs": all_inputs,
             "outputs": outputs
         }
-    except Exception as e:
-        logger.error(f"Error parsing README {readme_path}: {e}")
-        logger.error(traceback.format_exc())
+    except (OSError, ValueError, re.error) as e:
+        logger.exception(f"Error parsing README {readme_path}: {e}")
         return {"inputs": {}, "outputs": {}}
 
+def _fetch_submodule(registry_fetcher: TerraformRegistryFetcher, info: Dict[str, str]) -> Optional[str]:
+    """
+    Fetch the README of one submodule listed in a module's README.
+    
+    Args:
+        registry_fetcher: Fetcher for the parent module, with its GitHub repository set
+        info: The submodule's "name", "path" and "description"
+        
+    Returns:
+        The path to the saved README, or None if it could not be fetched
+    """
+    submodule_name = info["name"]
+    logger.info("Processing submodule: %s at path: %s", submodule_name, info["path"])
+    
+    submodule_readme_path = registry_fetcher.fetch_submodule_readme(info["path"], submodule_name)
+    if not submodule_readme_path:
+        logger.warning("Failed to fetch README for submodule: %s", submodule_name)
+    return submodule_readme_path
+
+def _process_submodule(info: Dict[str, str], submodule_readme_path: str) -> Dict[str, Any]:
+    """
+    Parse the fetched README of one submodule into its JSON output entry.
+    
+    Args:
+        info: The submodule's "name", "path" and "description"
+        submodule_readme_path: Absolute path returned by _fetch_submodule
+        
+    Returns:
+        The submodule data for the JSON output
+    """
+    submodule_name = info["name"]
+    submodule_path = info["path"]
+    
+    # Parse the submodule README directly using the standalone function
+    parsed_data = parse_readme_directly(submodule_readme_path)
+    
+    return {
+        "name": submodule_name,
+        "path": submodule_path,
+        "description": info.get("description", ""),
+        "inputs": parsed_data["inputs"],
+        "outputs": parsed_data["outputs"]
+    }
+
 def main():
     """
     Main function to execute the parser.
@@ -1105,30 +1634,35 @@ def main():
                 
             logger.info(f"Using local README: {readme_path}")
         
+        # Read the README once; the same parser is used for naming and parsing
+        parser = ReadmeParser(readme_path)
+        parser.read_file()
+        
         # Derive output path from README path with new naming convention
         if "_README.md" in readme_path:
             module_name = os.path.basename(readme_path).replace("_README.md", "")
             output_path = os.path.join(script_dir, "output", f"{module_name}.json")
         else:
-            # Extract module name from the README content to create a more meaningful filename
-            temp_parser = ReadmeParser(readme_path)
-            temp_parser.read_file()
-            
-            # Try to extract module name from the first line or title of the README
-            lines = temp_parser.content.split('\n')
+            # Extract module name from the README title to create a more meaningful filename
             module_name = None
             
-            # Look for a title pattern in the first few lines
-            for line in lines[:10]:
-                if line.startswith('# '):
-                    # Extract module name from title, typically in format "# terraform-azurerm-avm-res-xxx-yyy"
-                    title = line.strip('# ').strip()
-                    if 'terraform' in title and '-' in title:
-                        # Extract the last part of the module name (e.g., "keyvault-vault" from "terraform-azurerm-avm-res-keyvault-vault")
-                        parts = title.split('-')
-                        if len(parts) >= 3:
-                            module_name = '-'.join(parts[-2:]) if len(parts) > 3 else parts[-1]
+            # Find the first title line in the first few lines, without splitting the content
+            content = parser.content
+            search_end = -1
+            for _ in range(_TITLE_SEARCH_LINES):
+                search_end = content.find('\n', search_end + 1)
+                if search_end < 0:
+                    search_end = len(content)
                     break
+            title_match = _TITLE_RE.search(content, 0, search_end)
+            if title_match:
+                # Extract module name from title, typically in format "# terraform-azurerm-avm-res-xxx-yyy"
+                title = title_match.group(0).strip('# ').strip()
+                if 'terraform' in title and '-' in title:
+                    # Extract the last part of the module name (e.g., "keyvault-vault" from "terraform-azurerm-avm-res-keyvault-vault")
+                    parts = title.split('-')
+                    if len(parts) >= 3:
+                        module_name = '-'.join(parts[-2:]) if len(parts) > 3 else parts[-1]
             
             # If we couldn't extract a name, use a more generic but meaningful name
             if not module_name:
@@ -1136,20 +1670,12 @@ def main():
                 module_name = os.path.basename(readme_path).replace(".md", "").lower() or "terraform_module"
             
             # Clean up the module name for use as a filename
-            module_name = module_name.replace("-", "_").replace(" ", "_")
+            module_name = module_name.translate(_SAFE_NAME_TRANS)
             output_path = os.path.join(script_dir, "output", f"{module_name}.json")
         
-        # Ensure output directory exists
-        os.makedirs(os.path.join(script_dir, "output"), exist_ok=True)
-        
         logger.info(f"README path: {readme_path}")
         logger.info(f"Output path: {output_path}")
         
-        # Initialize parser and parse README
-        parser = ReadmeParser(readme_path)
-        
-        parser.read_file()
-        
         # Process submodules if registry fetcher is available
         submodules_data = {}
         if registry_fetcher and registry_fetcher.github_repo:
@@ -1160,13 +1686,8 @@ def main():
             if modules_section:
                 logger.info("Found 'Modules' section in README")
                 
-                # Pattern to match module entries in the format:
-                # ### <a name="module_name"></a> [name](#module\_name)
-                # 
-                # Source: ./path/to/module
-                module_pattern = r"### <a name=\"module_(.*?)\"></a> \[(.*?)\].*?Source: (.*?)(?:\n\n|\Z)"
-                
-                matches = re.finditer(module_pattern, modules_section, re.DOTALL)
+                # Match module entries (see _MODULE_ENTRY_RE)
+                matches = _MODULE_ENTRY_RE.finditer(modules_section)
                 submodule_infos = []
                 
                 for match in matches:
@@ -1178,7 +1699,7 @@ def main():
                     if source_path.startswith('./'):
                         source_path = source_path[2:]
                         
-                    logger.info(f"Found submodule: {name} at path: {source_path}")
+                    logger.info("Found submodule: %s at path: %s", name, source_path)
                     
                     submodule_infos.append({
                         "id": module_id,
@@ -1187,34 +1708,23 @@ def main():
                         "description": ""  # Description might not be available in this format
                     })
                 
-                # Process each submodule
-                for info in submodule_infos:
-                    submodule_name = info["name"]
-                    submodule_path = info["path"]
-                    logger.info(f"Processing submodule: {submodule_name} at path: {submodule_path}")
+                # Download all submodule READMEs concurrently, since each is
+                # dominated by its GitHub round-trip, then parse them here once
+                # every download is done. Results are stored in the order listed.
+                if submodule_infos:
+                    with ThreadPoolExecutor(max_workers=min(_SUBMODULE_FETCH_WORKERS, len(submodule_infos))) as executor:
+                        readme_paths = list(executor.map(
+                            lambda info: _fetch_submodule(registry_fetcher, info),
+                            submodule_infos
+                        ))
                     
-                    # Fetch and save the submodule README
-                    submodule_readme_path = registry_fetcher.fetch_submodule_readme(submodule_path, submodule_name)
-                    if not submodule_readme_path:
-                        logger.warning(f"Failed to fetch README for submodule: {submodule_name}")
-                        continue
-                    
-                    # Parse the submodule README directly using the standalone function
-                    submodule_readme_path = os.path.join(script_dir, submodule_readme_path)
-                    parsed_data = parse_readme_directly(submodule_readme_path)
-                    
-                    # Store the parsed data
-                    submodules_data[submodule_name] = {
-                        "name": submodule_name,
-                        "path": submodule_path,
-                        "description": info.get("description", ""),
-                        "inputs": parsed_data["inputs"],
-                        "outputs": parsed_data["outputs"]
-                    }
+                    for info, submodule_readme_path in zip(submodule_infos, readme_paths):
+                        if submodule_readme_path:
+                            submodules_data[info["name"]] = _process_submodule(info, submodule_readme_path)
             
             # If we found submodules, add them to the parser
             if submodules_data:
-                logger.info(f"Found and processed {len(submodules_data)} submodules")
+                logger.info("Found and processed %d submodules", len(submodules_data))
                 parser.set_submodules(submodules_data)
         
         # Generate the parsed data with submodules included
@@ -1240,25 +1750,27 @@ def main():
             logger.info(f"  - Submodules: {submodules_count}")
             
             if submodules_count > 0:
-                logger.info(f"Submodules:")
+                logger.info("Submodules:")
                 for name, data in module_data.get("submodules", {}).items():
                     submodule_inputs = len(data.get("inputs", {}))
                     submodule_outputs = len(data.get("outputs", {}))
-                    logger.info(f"  - {name}: {submodule_inputs} inputs, {submodule_outputs} outputs")
+                    logger.info("  - %s: %d inputs, %d outputs", name, submodule_inputs, submodule_outputs)
         else:
             logger.warning("No data was parsed from the README")
         
         # Generate and save JSON
-        json_data = parser.to_json(output_path)
-        if json_data:
+        if parser.write_json(output_path):
             logger.info(f"Successfully generated JSON and saved to {output_path}")
             
-            # Validate JSON syntax by trying to parse it
-            try:
-                json.loads(json_data)
-                logger.info("JSON validation successful")
-            except json.JSONDecodeError as e:
-                logger.error(f"JSON validation failed: {e}")
+            # json.dump output is valid by construction; re-parsing it is only
+            # worthwhile as an opt-in sanity check (AVM_VALIDATE_JSON=1)
+            if __debug__ and os.environ.get("AVM_VALIDATE_JSON"):
+                try:
+                    with open(output_path, 'r') as file:
+                        json.load(file)
+                    logger.info("JSON validation successful")
+                except json.JSONDecodeError as e:
+                    logger.error(f"JSON validation failed: {e}")
             
             logger.info("Parser completed successfully")
             print(f"JSON data written to {output_path}")
@@ -1267,8 +1779,7 @@ def main():
             print("Error: Failed to generate JSON data. Check the logs for details.")
     
     except Exception as e:
-        logger.error(f"Error during parsing: {e}")
-        logger.error(traceback.format_exc())
+        logger.exception(f"Error during parsing: {e}")
         print(f"Error: An unexpected error occurred: {e}")
         print("Check the logs for more details.")
             